@@ -1,9 +1,11 @@
+import asyncio
 import os
-from typing import (Any, ClassVar, Dict, Final, List, Mapping, Optional,
+import time
+from typing import (Any, ClassVar, Dict, List, Mapping, NamedTuple, Optional,
                     Sequence, Tuple)
 
 from typing_extensions import Self
-from viam.components.sensor import *
+from viam.components.sensor import Sensor
 from viam.proto.app.robot import ComponentConfig
 from viam.proto.common import Geometry, ResourceName
 from viam.resource.base import ResourceBase
@@ -11,7 +13,112 @@ from viam.resource.easy_resource import EasyResource
 from viam.resource.types import Model, ModelFamily
 from viam.utils import SensorReading, ValueTypes
 from viam.app.viam_client import ViamClient
-from viam.rpc.dial import DialOptions, Credentials
+from viam.rpc.dial import DialOptions
+
+
+DEFAULT_CACHE_TTL_SECONDS = 10.0
+
+# Shared readings returned when metadata cannot be fetched; never mutated.
+# Plain dicts rather than MappingProxyType because the SDK only serializes dicts.
+_EMPTY_READINGS: Mapping[str, SensorReading] = {
+    "robot": {},
+    "part": {}
+}
+
+class _ScopeHandler(NamedTuple):
+    """How to read and update the metadata for one scope."""
+
+    get: str  # AppClient method that fetches the metadata
+    update: str  # AppClient method that replaces the metadata
+    id_attr: str  # Instance attribute holding the robot or part ID
+    id_key: str  # Key of the ID in do_command results
+    label: str  # Name used in do_command result messages
+
+
+class _MetadataEntry:
+    """Shared cache state for the metadata of one robot or robot part."""
+
+    def __init__(self):
+        # Last successfully fetched metadata and the time its fetch started
+        self.metadata: Optional[Dict[str, Any]] = None
+        self.fetched_at = 0.0
+        # Fetch in flight, if any, and the time it started
+        self.pending: Optional["asyncio.Future[Dict[str, Any]]"] = None
+        self.pending_at = 0.0
+
+    def store(self, future: "asyncio.Future[Dict[str, Any]]"):
+        """Record the result of a finished fetch started for this entry."""
+        if self.pending is future:
+            self.pending = None
+            if not future.cancelled() and future.exception() is None:
+                self.metadata = future.result()
+                self.fetched_at = self.pending_at
+
+
+# (scope, robot or part ID, API key ID, API key) -> shared cache entry. Shared
+# by all instances using the same credentials so sensors for the same machine
+# reuse one fetch, including one that is still in flight. Each instance judges
+# freshness with its own cache_ttl_seconds, and an update drops the entries for
+# that robot or part so no instance serves the pre-update metadata.
+_METADATA_CACHE: Dict[Tuple[str, str, str, str], _MetadataEntry] = {}
+
+
+class _SharedClient:
+    """A ViamClient shared by all instances using the same credentials."""
+
+    def __init__(self, key: Tuple[str, str]):
+        api_key_id, api_key = key
+        self.key = key
+        self.dial = asyncio.ensure_future(ViamClient.create_from_dial_options(
+            DialOptions.with_api_key(api_key=api_key, api_key_id=api_key_id)
+        ))
+        # Number of instances holding this client
+        self.refs = 0
+
+    def failed(self) -> bool:
+        """Whether dialing this client failed or was cancelled."""
+        return self.dial.done() and (self.dial.cancelled() or self.dial.exception() is not None)
+
+    def release(self):
+        """Drop one reference, closing the client once no instance holds it."""
+        self.refs -= 1
+        if self.refs > 0:
+            return
+        if _VIAM_CLIENTS.get(self.key) is self:
+            del _VIAM_CLIENTS[self.key]
+        if self.dial.done():
+            _close_dialed(self.dial)
+        else:
+            self.dial.add_done_callback(_close_dialed)
+
+
+def _close_dialed(dial: "asyncio.Future[ViamClient]"):
+    """Close the ViamClient of a finished dial, if it succeeded."""
+    if not dial.cancelled() and dial.exception() is None:
+        dial.result().close()
+
+
+# (API key ID, API key) -> shared client, so one gRPC channel serves every
+# instance with those credentials and outlives any single one of them
+_VIAM_CLIENTS: Dict[Tuple[str, str], _SharedClient] = {}
+
+
+async def _acquire_viam_client(api_key_id: str, api_key: str) -> _SharedClient:
+    """Get a reference to the shared client for the credentials, dialing it if needed.
+
+    The caller must call `release()` on the result once done with it.
+    """
+    key = (api_key_id, api_key)
+    shared = _VIAM_CLIENTS.get(key)
+    if shared is None or shared.failed():
+        shared = _VIAM_CLIENTS[key] = _SharedClient(key)
+    shared.refs += 1
+    try:
+        await asyncio.shield(shared.dial)
+    except BaseException:
+        shared.release()
+        raise
+    return shared
 
 
 class UserDefinedMetadata(Sensor, EasyResource):
@@ -21,29 +128,83 @@ class UserDefinedMetadata(Sensor, EasyResource):
         ModelFamily("viam-soleng", "sensor"), "user-defined-metadata"
     )
 
+    _SCOPE_HANDLERS: ClassVar[Dict[str, _ScopeHandler]] = {
+        "robot": _ScopeHandler("get_robot_metadata", "update_robot_metadata", "_robot_id", "robot_id", "Robot"),
+        "part": _ScopeHandler("get_robot_part_metadata", "update_robot_part_metadata", "_robot_part_id", "robot_part_id", "Robot part"),
+    }
+    _UPDATE_MODES: ClassVar[frozenset] = frozenset(("replace", "merge"))
+
     def __init__(self, name: str):
         super().__init__(name)
+        self._shared_client = None
         self._viam_client = None
+        self._app_client = None
+        self._client_lock = asyncio.Lock()
+        self._cache_ttl = DEFAULT_CACHE_TTL_SECONDS
+        # Machine identity is fixed for the lifetime of the process, so read it
+        # from the environment once. API credentials may be overridden by the
+        # api_key/api_key_id attributes in reconfigure.
+        self._api_key = os.getenv("VIAM_API_KEY")
+        self._api_key_id = os.getenv("VIAM_API_KEY_ID")
+        self._robot_id = os.getenv("VIAM_MACHINE_ID")
+        self._robot_part_id = os.getenv("VIAM_MACHINE_PART_ID")
+
+    def _check_machine_ids(self):
+        """Ensure the robot and robot part IDs were found in the environment."""
+        if not self._robot_id:
+            raise ValueError("VIAM_MACHINE_ID environment variable is required")
+        if not self._robot_part_id:
+            raise ValueError("VIAM_MACHINE_PART_ID environment variable is required")
 
     async def _get_viam_client(self) -> ViamClient:
-        """Get or create a ViamClient instance."""
+        """Get or create a ViamClient instance.
+
+        The client is shared by all calls, and by all instances with the same
+        credentials, so that its gRPC channel is reused; the lock keeps
+        concurrent callers from acquiring it twice.
+        """
         if self._viam_client is None:
-            # Get credentials from environment variables
-            api_key = os.getenv("VIAM_API_KEY")
-            api_key_id = os.getenv("VIAM_API_KEY_ID")
-            
-            if not api_key or not api_key_id:
-                raise ValueError("VIAM_API_KEY and VIAM_API_KEY_ID environment variables must be set")
-            
-            dial_options = DialOptions.with_api_key( 
-                api_key=api_key,
-                api_key_id=api_key_id
-            )
-            
-            self._viam_client = await ViamClient.create_from_dial_options(dial_options)
-            
+            async with self._client_lock:
+                while self._viam_client is None:
+                    api_key, api_key_id = self._api_key, self._api_key_id
+                    if not api_key or not api_key_id:
+                        raise ValueError("api_key and api_key_id attributes or VIAM_API_KEY and VIAM_API_KEY_ID environment variables must be set")
+
+                    shared = await _acquire_viam_client(api_key_id, api_key)
+                    if (api_key, api_key_id) != (self._api_key, self._api_key_id):
+                        # reconfigure changed the credentials while dialing;
+                        # let go of this client and get one for the new ones
+                        shared.release()
+                        continue
+                    viam_client = shared.dial.result()
+                    self._shared_client = shared
+                    self._app_client = viam_client.app_client
+                    self._viam_client = viam_client
+
         return self._viam_client
 
+    async def _get_app_client(self):
+        """Get the cached AppClient of the shared ViamClient."""
+        if self._app_client is None:
+            await self._get_viam_client()
+        return self._app_client
+
+    def _drop_client(self):
+        """Let go of the ViamClient, if one was acquired, so the next call gets a new one.
+
+        The client's gRPC channel is closed once no instance holds it.
+        """
+        shared = self._shared_client
+        self._shared_client = None
+        self._viam_client = None
+        self._app_client = None
+        if shared is not None:
+            shared.release()
+
+    async def close(self):
+        """Let go of the ViamClient, closing its gRPC channel if no other instance uses it."""
+        self._drop_client()
+
     @classmethod
     def new(
         cls, config: ComponentConfig, dependencies: Mapping[ResourceName, ResourceBase]
@@ -75,6 +236,16 @@ class UserDefinedMetadata(Sensor, EasyResource):
                 first element is a list of required dependencies and the
                 second element is a list of optional dependencies
         """
+        fields = config.attributes.fields
+        if "cache_ttl_seconds" in fields:
+            value = fields["cache_ttl_seconds"]
+            if value.WhichOneof("kind") != "number_value" or value.number_value < 0:
+                raise ValueError("cache_ttl_seconds must be a non-negative number")
+        for attr in ("api_key", "api_key_id"):
+            if attr in fields and fields[attr].WhichOneof("kind") != "string_value":
+                raise ValueError(f"{attr} must be a string")
+        if ("api_key" in fields) != ("api_key_id" in fields):
+            raise ValueError("api_key and api_key_id must be set together")
         return [], []
 
     def reconfigure(
@@ -86,6 +257,24 @@ class UserDefinedMetadata(Sensor, EasyResource):
             config (ComponentConfig): The new configuration
             dependencies (Mapping[ResourceName, ResourceBase]): Any dependencies (both required and optional)
         """
+        fields = config.attributes.fields
+        if "cache_ttl_seconds" in fields:
+            self._cache_ttl = fields["cache_ttl_seconds"].number_value
+        else:
+            self._cache_ttl = DEFAULT_CACHE_TTL_SECONDS
+
+        # Keep the existing client, and its warm gRPC channel, unless the
+        # credentials it was dialed with have changed
+        if "api_key" in fields:
+            api_key = fields["api_key"].string_value
+            api_key_id = fields["api_key_id"].string_value
+        else:
+            api_key = os.getenv("VIAM_API_KEY")
+            api_key_id = os.getenv("VIAM_API_KEY_ID")
+        if (api_key, api_key_id) != (self._api_key, self._api_key_id):
+            self._api_key = api_key
+            self._api_key_id = api_key_id
+            self._drop_client()
         return super().reconfigure(config, dependencies)
 
     async def get_readings(
@@ -97,26 +286,36 @@ class UserDefinedMetadata(Sensor, EasyResource):
     ) -> Mapping[str, SensorReading]:
         """Get robot and robot part user-defined metadata.
         
+        Results are cached for `cache_ttl_seconds` (10 seconds by default).
+        
         Returns:
             Mapping[str, SensorReading]: Dictionary with 'robot' and 'part' keys containing 
                                        the respective metadata
         """
         try:
-            # Get required environment variables
-            robot_id = os.getenv("VIAM_MACHINE_ID")
-            robot_part_id = os.getenv("VIAM_MACHINE_PART_ID")
-            
-            if not robot_id:
-                raise ValueError("VIAM_MACHINE_ID environment variable is required")
-            if not robot_part_id:
-                raise ValueError("VIAM_MACHINE_PART_ID environment variable is required")
-            
-            # Get viam client
-            viam_client = await self._get_viam_client()
-            app_client = viam_client.app_client
-            # Fetch robot and robot part metadata
-            robot_metadata = await app_client.get_robot_metadata(robot_id)
-            part_metadata = await app_client.get_robot_part_metadata(robot_part_id)
+            self._check_machine_ids()
+            robot_metadata = self._cached_metadata("robot")
+            part_metadata = self._cached_metadata("part")
+            if robot_metadata is not None and part_metadata is not None:
+                return {
+                    "robot": robot_metadata,
+                    "part": part_metadata
+                }
+
+            app_client = await self._get_app_client()
+            # Fetch robot and robot part metadata concurrently; a failure of one
+            # fetch still returns the other
+            robot_metadata, part_metadata = await asyncio.gather(
+                self._fetch_metadata(app_client, "robot"),
+                self._fetch_metadata(app_client, "part"),
+                return_exceptions=True
+            )
+            if isinstance(robot_metadata, BaseException):
+                self.logger.error("Error fetching robot metadata: %s", robot_metadata)
+                robot_metadata = {}
+            if isinstance(part_metadata, BaseException):
+                self.logger.error("Error fetching robot part metadata: %s", part_metadata)
+                part_metadata = {}
             
             return {
                 "robot": robot_metadata,
@@ -124,12 +323,193 @@ class UserDefinedMetadata(Sensor, EasyResource):
             }
             
         except Exception as e:
-            self.logger.error(f"Error fetching metadata: {e}")
+            self.logger.error("Error fetching metadata: %s", e)
             # Return empty metadata in case of error
-            return {
-                "robot": {},
-                "part": {}
-            }
+            return _EMPTY_READINGS
+
+    def _metadata_key(self, scope: str) -> Tuple[str, str, str, str]:
+        """Get the _METADATA_CACHE key for a scope of this machine and these credentials."""
+        return (scope, getattr(self, self._SCOPE_HANDLERS[scope].id_attr),
+                self._api_key_id, self._api_key)
+
+    def _drop_cached_metadata(self, scope: str):
+        """Drop the shared cached metadata for a scope of this machine, for all credentials."""
+        scope_id = self._metadata_key(scope)[:2]
+        for key in [key for key in _METADATA_CACHE if key[:2] == scope_id]:
+            del _METADATA_CACHE[key]
+
+    def _cached_metadata(self, scope: str) -> Optional[Dict[str, Any]]:
+        """Get the shared cached metadata for a scope if it is younger than `cache_ttl_seconds`."""
+        entry = _METADATA_CACHE.get(self._metadata_key(scope))
+        if entry is not None and entry.metadata is not None:
+            if time.monotonic() - entry.fetched_at < self._cache_ttl:
+                return entry.metadata
+        return None
+
+    async def _fetch_metadata(self, app_client, scope: str) -> Dict[str, Any]:
+        """Fetch the metadata for a scope through the shared module-level cache.
+
+        Cached metadata younger than `cache_ttl_seconds` is returned as is, and
+        concurrent callers for the same robot or part await the same in-flight
+        fetch.
+        """
+        metadata = self._cached_metadata(scope)
+        if metadata is not None:
+            return metadata
+
+        key = self._metadata_key(scope)
+        entry = _METADATA_CACHE.get(key)
+        if entry is None:
+            entry = _METADATA_CACHE[key] = _MetadataEntry()
+        if entry.pending is None:
+            entry.pending_at = time.monotonic()
+            entry.pending = asyncio.ensure_future(
+                getattr(app_client, self._SCOPE_HANDLERS[scope].get)(key[1])
+            )
+            entry.pending.add_done_callback(entry.store)
+        # Shield the shared fetch so a cancelled caller does not cancel it for
+        # the others awaiting it
+        return await asyncio.shield(entry.pending)
+
+    @classmethod
+    def _validate_update(cls, update: Mapping[str, ValueTypes]) -> Tuple[str, Dict[str, Any], str]:
+        """Validate a single scoped metadata update.
+
+        Args:
+            update: Dictionary with 'scope', 'metadata' and optional 'mode' keys
+
+        Returns:
+            Tuple[str, Dict[str, Any], str]: The scope, metadata and mode of the update
+        """
+        if not isinstance(update, dict):
+            raise ValueError("Update must be a dictionary")
+
+        scope = update.get("scope")
+        metadata = update.get("metadata")
+        mode = update.get("mode", "replace")
+
+        if scope not in cls._SCOPE_HANDLERS:
+            raise ValueError(f"Invalid scope: {scope}. Must be 'part' or 'robot'.")
+
+        if not isinstance(metadata, dict):
+            raise ValueError("metadata must be a dictionary")
+
+        if mode not in cls._UPDATE_MODES:
+            raise ValueError(f"Invalid mode: {mode}. Must be 'replace' or 'merge'.")
+
+        return scope, metadata, mode
+
+    async def _update_metadata(self, app_client, scope: str, metadata: Dict[str, Any], mode: str) -> Dict[str, ValueTypes]:
+        """Apply a single validated metadata update.
+
+        With the "merge" mode the given keys are merged over the current metadata,
+        read fresh from the server, instead of replacing it, and the write is
+        skipped if nothing changes.
+
+        Args:
+            app_client: The AppClient to issue the update with
+            scope: 'robot' or 'part'
+            metadata: The metadata to write
+            mode: 'replace' or 'merge'
+
+        Returns:
+            Dictionary with the update result
+        """
+        handler = self._SCOPE_HANDLERS[scope]
+        resource_id = getattr(self, handler.id_attr)
+
+        if mode == "merge":
+            # Merge over a fresh read rather than the cache: the merged result
+            # replaces the whole metadata, so a stale read would revert changes
+            # made by other clients
+            current = await getattr(app_client, handler.get)(resource_id)
+            merged = {**current, **metadata}
+            if merged == current:
+                return {
+                    "success": True,
+                    "noop": True,
+                    "message": f"{handler.label} metadata unchanged",
+                    "scope": scope,
+                    handler.id_key: resource_id
+                }
+            metadata = merged
+
+        await getattr(app_client, handler.update)(resource_id, metadata)
+        self._drop_cached_metadata(scope)
+        self.logger.info("Successfully updated %s metadata for %s %s", handler.label.lower(), scope, resource_id)
+        return {
+            "success": True,
+            "message": f"{handler.label} metadata updated successfully",
+            "scope": scope,
+            handler.id_key: resource_id
+        }
+
+    def _update_error(self, update: Mapping[str, ValueTypes], error: BaseException) -> Dict[str, ValueTypes]:
+        """Log a failed update and build its error result."""
+        error_msg = f"Error updating metadata: {error}"
+        self.logger.error(error_msg)
+        return {
+            "success": False,
+            "error": error_msg,
+            "scope": update.get("scope", "unknown") if isinstance(update, dict) else "unknown",
+            "command": "update"
+        }
+
+    async def _apply_updates(self, updates: List[Mapping[str, ValueTypes]]) -> List[Dict[str, ValueTypes]]:
+        """Apply scoped metadata updates, concurrently across scopes.
+
+        All updates are validated before any request is made. A failed update
+        does not abort the others; its entry in the result list holds the error
+        instead.
+
+        Args:
+            updates: List of dictionaries with 'scope', 'metadata' and optional 'mode' keys
+
+        Returns:
+            List with one result dictionary per update, in order
+        """
+        results: List[Optional[Dict[str, ValueTypes]]] = [None] * len(updates)
+        valid = []
+        for i, update in enumerate(updates):
+            try:
+                valid.append((i, self._validate_update(update)))
+            except ValueError as e:
+                results[i] = self._update_error(update, e)
+
+        if valid:
+            self._check_machine_ids()
+            app_client = await self._get_app_client()
+
+            # Updates to different scopes run concurrently, but updates to the
+            # same scope run in order so a merge sees the previous write
+            by_scope: Dict[str, List[Tuple[int, Tuple[str, Dict[str, Any], str]]]] = {}
+            for i, validated in valid:
+                by_scope.setdefault(validated[0], []).append((i, validated))
+
+            scope_outcomes = await asyncio.gather(
+                *(self._apply_scope_updates(app_client, entries) for entries in by_scope.values())
+            )
+
+            for outcomes in scope_outcomes:
+                for i, outcome in outcomes:
+                    if isinstance(outcome, BaseException):
+                        outcome = self._update_error(updates[i], outcome)
+                    results[i] = outcome
+        return results
+
+    async def _apply_scope_updates(self, app_client, entries: List[Tuple[int, Tuple[str, Dict[str, Any], str]]]) -> List[Tuple[int, Any]]:
+        """Apply validated updates for a single scope one after another.
+
+        Returns:
+            List of (update index, result or exception) pairs
+        """
+        outcomes = []
+        for i, validated in entries:
+            try:
+                outcomes.append((i, await self._update_metadata(app_client, *validated)))
+            except Exception as e:
+                outcomes.append((i, e))
+        return outcomes
 
     async def do_command(
         self,
@@ -144,7 +524,14 @@ class UserDefinedMetadata(Sensor, EasyResource):
         {
             "command": "update",
             "scope": "part|robot", 
-            "metadata": <python dict>
+            "metadata": <python dict>,
+            "mode": "replace|merge"  # optional, defaults to "replace"
+        }
+
+        or, to apply several updates concurrently:
+        {
+            "command": "update_bulk",
+            "updates": [{"scope": "part|robot", "metadata": <python dict>, "mode": ...}, ...]
         }
         
         Args:
@@ -154,56 +541,33 @@ class UserDefinedMetadata(Sensor, EasyResource):
         Returns:
             Dictionary with operation result
         """
+        # Bind these once, outside the try, so the error path can report them
+        # without touching a command that may not be a dictionary
+        is_dict = isinstance(command, dict)
+        cmd = command.get("command") if is_dict else None
+        scope = command.get("scope") if is_dict else None
+
         try:
             # Validate command structure
-            if not isinstance(command, dict):
+            if not is_dict:
                 raise ValueError("Command must be a dictionary")
-                
-            cmd = command.get("command")
-            scope = command.get("scope")
-            metadata = command.get("metadata")
-            
-            if cmd != "update":
-                raise ValueError(f"Unsupported command: {cmd}. Only 'update' is supported.")
-                
-            if scope not in ["part", "robot"]:
-                raise ValueError(f"Invalid scope: {scope}. Must be 'part' or 'robot'.")
-                
-            if not isinstance(metadata, dict):
-                raise ValueError("metadata must be a dictionary")
-            
-            # Get required environment variables
-            robot_id = os.getenv("VIAM_MACHINE_ID")
-            robot_part_id = os.getenv("VIAM_MACHINE_PART_ID")
             
-            if not robot_id:
-                raise ValueError("VIAM_MACHINE_ID environment variable is required")
-            if not robot_part_id:
-                raise ValueError("VIAM_MACHINE_PART_ID environment variable is required")
-            
-            # Get viam client
-            viam_client = await self._get_viam_client()
-            app_client = viam_client.app_client
-
-            # Update metadata based on scope
-            if scope == "robot":
-                await app_client.update_robot_metadata(robot_id, metadata)
-                self.logger.info(f"Successfully updated robot metadata for robot {robot_id}")
-                return {
-                    "success": True,
-                    "message": f"Robot metadata updated successfully",
-                    "scope": "robot",
-                    "robot_id": robot_id
-                }
-            elif scope == "part":
-                await app_client.update_robot_part_metadata(robot_part_id, metadata)
-                self.logger.info(f"Successfully updated robot part metadata for part {robot_part_id}")
+            if cmd == "update":
+                results = await self._apply_updates([command])
+                return results[0]
+
+            if cmd == "update_bulk":
+                updates = command.get("updates")
+                if not isinstance(updates, list):
+                    raise ValueError("updates must be a list")
+                results = await self._apply_updates(updates)
                 return {
-                    "success": True,
-                    "message": f"Robot part metadata updated successfully",
-                    "scope": "part",
-                    "robot_part_id": robot_part_id
+                    "success": all(result["success"] for result in results),
+                    "command": "update_bulk",
+                    "results": results
                 }
+
+            raise ValueError(f"Unsupported command: {cmd}. Only 'update' and 'update_bulk' are supported.")
                 
         except Exception as e:
             error_msg = f"Error updating metadata: {e}"
@@ -211,8 +575,8 @@ class UserDefinedMetadata(Sensor, EasyResource):
             return {
                 "success": False,
                 "error": error_msg,
-                "scope": command.get("scope", "unknown"),
-                "command": command.get("command", "unknown")
+                "scope": scope if scope is not None else "unknown",
+                "command": cmd if cmd is not None else "unknown"
             }
 
     async def get_geometries(